@@ -103,11 +103,13 @@ def plot(plot_dir):
         Virtual_layer("continuous_iter", func=None, output=False)
     )
     
-    cmap_func = lambda x: sign * np.where(
-       np.isinf(x),
-       np.log(DEM_min),
-       np.log(np.clip(x, DEM_min, None))
-    )
+    def cmap_func(x):
+        # One output buffer, log and sign in place (+inf -> DEM_min)
+        out = np.clip(x, DEM_min, None)
+        out[np.isinf(out)] = DEM_min
+        np.log(out, out=out)
+        out *= sign
+        return out
     plotter.add_layer(Color_layer(
             "distance_estimation",
             func=cmap_func,
@@ -139,11 +139,13 @@ def plot(plot_dir):
 
     sign = {False: 1., True: -1.}[invert_cmap]
     if base_layer == 'distance_estimation':
-        cmap_func = lambda x: sign * np.where(
-           np.isinf(x),
-           np.log(DEM_min),
-           np.log(np.clip(x, DEM_min, None))
-        )
+        def cmap_func(x):
+            # One output buffer, log and sign in place (+inf -> DEM_min)
+            out = np.clip(x, DEM_min, None)
+            out[np.isinf(out)] = DEM_min
+            np.log(out, out=out)
+            out *= sign
+            return out
     else:
         cmap_func = lambda x: sign * np.log(x)
 
@@ -27,6 +27,7 @@ Attached are the auto-generated images of the colormap templates available.
 """
 import os
 import sys
+import concurrent.futures
 
 if sys.version_info < (3, 9):
 # See :
@@ -43,7 +44,7 @@ import fractalshades as fs
 import fractalshades.colors as fscolors
 
 
-def plot_cmap(cmap_identifier, plot_dir, nx=600, ny=40):
+def cmap_image(cmap_identifier, nx=600, ny=40):
     cmap_register = fscolors.cmap_register
     cmap = cmap_register[cmap_identifier]
     B = cmap._output(nx, ny)
@@ -51,7 +52,6 @@ def plot_cmap(cmap_identifier, plot_dir, nx=600, ny=40):
     C = np.empty((ny * 2, nx, 3), dtype=np.uint8)
     C [ny:, :, :] = B
     C [:ny, :, :] = 255
-    # B[:(ny // 2), :, :] = 255
     im = PIL.Image.fromarray(C)
     draw = ImageDraw.Draw(im)
 
@@ -62,6 +62,10 @@ def plot_cmap(cmap_identifier, plot_dir, nx=600, ny=40):
         font = ImageFont.truetype(str(font_file.resolve()), size=26)
 
     draw.text((0,0), cmap_identifier, (0, 0, 0), font=font)
+    return im
+
+
+def save_cmap_image(im, cmap_identifier, plot_dir):
     fs.utils.mkdir_p(plot_dir)
 
     if fs.settings.output_context["doc"]:
@@ -75,10 +79,38 @@ def plot_cmap(cmap_identifier, plot_dir, nx=600, ny=40):
     else:
         im.save(os.path.join(plot_dir, cmap_identifier + ".png"))
 
+
+def plot_cmap(cmap_identifier, plot_dir, nx=600, ny=40):
+    im = cmap_image(cmap_identifier, nx, ny)
+    save_cmap_image(im, cmap_identifier, plot_dir)
+
+
 def plot_cmaps(plot_dir):
-    cmap_register = fscolors.cmap_register
-    for cmap_identifier in cmap_register.keys():
-        plot_cmap(cmap_identifier, plot_dir)
+    cmap_identifiers = list(fscolors.cmap_register.keys())
+
+    if not fs.settings.enable_multithreading:
+        for cmap_identifier in cmap_identifiers:
+            plot_cmap(cmap_identifier, plot_dir)
+        return
+
+    # The templates are independent: render them concurrently
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=os.cpu_count()
+    ) as threadpool:
+        if fs.settings.output_context["doc"]:
+            # Keep the output order (figures are staged in this order for
+            # the documentation)
+            ims = threadpool.map(cmap_image, cmap_identifiers)
+            for cmap_identifier, im in zip(cmap_identifiers, ims):
+                save_cmap_image(im, cmap_identifier, plot_dir)
+        else:
+            # PNG encoding and file writing also done in the workers
+            futures = [
+                threadpool.submit(plot_cmap, cmap_identifier, plot_dir)
+                for cmap_identifier in cmap_identifiers
+            ]
+            for fut in concurrent.futures.as_completed(futures):
+                fut.result()
 
 
 if __name__ == "__main__":
@@ -667,7 +667,12 @@ class Fractal_colormap:
         z = np.ravel(z)
         z = self.normalize(z, probes_z)
         # linear interpolation in sorted color array
-        indices = np.searchsorted(np.arange(self._n_interp_colors), z)
+        # z is a float index in [0, n_interp_colors - 1] so that its ceil
+        # is the bracketing index (no need for a per-pixel sorted search).
+        # nan are sent past the end as np.searchsorted would do.
+        indices = np.ceil(z)
+        indices[np.isnan(z)] = self._n_interp_colors
+        indices = indices.astype(np.intp)
         alpha = indices - z
         search_colors = np.vstack([
             self._interp_colors[0, :],
@@ -782,11 +787,8 @@ class Image_interpolator:
             raise ValueError("x and y shall have same shape")
         xr= np.ravel(x)
         yr = np.ravel(y)
-        print("channels", self._im)
-        # channels <PIL.PngImagePlugin.PngImageFile image mode=RGB size=3600x3600 at 0x7FF2C0CA20A0>
         im_arr = np.array(self._im)
         for ic in range(3):
-            print("channel", ic)
             channel = im_arr[:, :, ic]#self._im.getchannel(ic)
             out = np.empty(len(xr))
             im_interpolate(channel, xr, yr, wrap, screen_coord, out)
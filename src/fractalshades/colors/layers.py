@@ -833,50 +833,94 @@ class Blinn_lighting:
 
     def shade(self, rgb, normal):
         nx, ny, _ = rgb.shape
-        XYZ = _2d_rgb_to_XYZ(rgb, nx, ny)
-        XYZ_shaded = XYZ * self.k_ambient * self.color_ambient
-        for ls in self.light_sources:
-            XYZ_shaded += self.partial_shade(ls, XYZ, normal)
-        return _2d_XYZ_to_rgb(XYZ_shaded, nx, ny)
+        XYZ = _2d_rgb_to_XYZ(rgb, nx, ny).reshape(nx * ny, 3)
 
-    def partial_shade(self, ls, XYZ, normal):
-        theta_LS, phi_LS = ls['angles_radian']
+        # Normal vector coordinates, one row per pixel. Lighting is computed
+        # in the normal map precision (float32 from the plotter postprocs)
+        dtype = normal.real.dtype
+        N = np.empty((nx * ny, 3), dtype=dtype)
+        N[:, 0] = normal.real.ravel()
+        N[:, 1] = normal.imag.ravel()
+        N[:, 2] = np.sqrt(1. - N[:, 0] ** 2 - N[:, 1] ** 2) # cos of max_slope
 
-        # Light source coordinates
-        LSx = np.cos(theta_LS) * np.cos(phi_LS)
-        LSy = np.sin(theta_LS) * np.cos(phi_LS)
-        LSz = np.sin(phi_LS) 
+        # All light sources are evaluated at once, one column per source
+        (L, diffuse_coeff, H, shininess, specular_coeff, specular_mat_coeff
+         ) = self.light_sources_arrays(dtype)
 
-        # Normal vector coordinates
-        nx = normal.real
-        ny = normal.imag
-        nz = np.sqrt(1. - nx**2 - ny**2) # cos of max_slope
-        lambert = LSx * nx + LSy * ny + LSz * nz
-        np.putmask(lambert, lambert < 0., 0.)
+        lambert = N @ L.T
+        np.maximum(lambert, 0., out=lambert)
+        XYZ_coeff = lambert @ diffuse_coeff
+        XYZ_coeff += self.k_ambient * self.color_ambient
 
         # half-way vector coordinates - Blinn Phong shading
-        specular = np.zeros_like(lambert)
-        if ls["k_specular"] != 0.:
+        if H.shape[0] > 0:
+            specular = N @ H.T
+            np.maximum(specular, 0., out=specular)
+            np.power(specular, shininess, out=specular)
+            XYZ_coeff += specular @ specular_coeff
+            XYZ_shaded = XYZ * XYZ_coeff + specular @ specular_mat_coeff
+        else:
+            XYZ_shaded = XYZ * XYZ_coeff
+
+        return _2d_XYZ_to_rgb(XYZ_shaded, nx, ny)
+
+    def light_sources_arrays(self, dtype=np.float64):
+        """
+        Stacks the light sources properties, one row per light source.
+        Returns the light directions and diffuse coefficients for all
+        sources, and the half-way directions, shininess and specular
+        coefficients (applied to the pixel color or to the material specular
+        color) for the sources with a specular component.
+        """
+        L = []
+        diffuse_coeff = []
+        H = []
+        shininess = []
+        specular_coeff = []
+        specular_mat_coeff = []
+
+        for ls in self.light_sources:
+            theta_LS, phi_LS = ls['angles_radian']
+            color = ls["color"]
+
+            # Light source coordinates
+            L += [(
+                np.cos(theta_LS) * np.cos(phi_LS),
+                np.sin(theta_LS) * np.cos(phi_LS),
+                np.sin(phi_LS)
+            )]
+            diffuse_coeff += [ls["k_diffuse"] * color * np.ones(3)]
+
+            if ls["k_specular"] == 0.:
+                continue
+
             # half azimuth angle vector between light and view
             phi_half = (np.pi * 0.5 + phi_LS) * 0.5
-            half_x = np.cos(theta_LS) * np.cos(phi_half)
-            half_y = np.sin(theta_LS) * np.cos(phi_half)
-            half_z = np.sin(phi_half)
+            H += [(
+                np.cos(theta_LS) * np.cos(phi_half),
+                np.sin(theta_LS) * np.cos(phi_half),
+                np.sin(phi_half)
+            )]
+            shininess += [ls["shininess"]]
+
+            k_specular = ls["k_specular"] * color * np.ones(3)
+            if ls["material_specular_color"] is None:
+                specular_coeff += [k_specular]
+                specular_mat_coeff += [np.zeros(3)]
+            else:
+                XYZ_sp = np.asarray(ls["material_specular_color"])
+                specular_coeff += [np.zeros(3)]
+                specular_mat_coeff += [k_specular * XYZ_sp]
 
-            specular_coeff = half_x * nx + half_y * ny + half_z * nz
-            np.putmask(specular_coeff, specular_coeff < 0., 0.)
-            specular = np.power(specular_coeff, ls["shininess"])
+        def as_2d(rows):
+            return np.array(rows, dtype=dtype).reshape(len(rows), 3)
 
-        if ls["material_specular_color"] is None:
-            res =  (ls["k_diffuse"] * lambert[:, :, np.newaxis] * XYZ
-                    + ls["k_specular"] * specular[:, :, np.newaxis]  * XYZ)
-        else:
-            XYZ_sp = np.asarray(ls["material_specular_color"])
-            res =  (ls["k_diffuse"] * lambert[:, :, np.newaxis] * XYZ
-                    + ls["k_specular"] * specular[:, :, np.newaxis]  * XYZ_sp)
+        return (
+            as_2d(L), as_2d(diffuse_coeff),
+            as_2d(H), np.array(shininess, dtype=dtype),
+            as_2d(specular_coeff), as_2d(specular_mat_coeff)
+        )
 
-        return res * ls["color"]
-    
     def _output(self, nx, ny):
         """ Return a RGB uint8 array of shape (nx, ny, 3)
         """
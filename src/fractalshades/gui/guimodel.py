@@ -20,6 +20,7 @@ import functools
 import mpmath
 import threading
 import ast
+import re
 
 if sys.version_info < (3, 9):
 # See :
@@ -72,6 +73,7 @@ from PyQt6.QtWidgets import (
     QGraphicsScene,
     QGraphicsView,
     QGraphicsPixmapItem,
+    QGraphicsItem,
     QGraphicsItemGroup,
     QGraphicsRectItem,
     QGraphicsLineItem,
@@ -358,6 +360,9 @@ class Action_func_widget(QFrame):
         self._submodel = func_smodel
         self.may_interrupt = may_interrupt
         self.locks_navigation = locks_navigation
+        # Code editors for params / script, created on first display
+        self._params_editor = None
+        self._script_editor = None
 
         # Parameters and action boxes
         param_box = self.add_param_box(func_smodel)
@@ -455,6 +460,8 @@ class Action_func_widget(QFrame):
             return pickle.load(param_file)
 
     def run_func(self):
+        # Edits still being debounced shall be part of this run
+        self._param_widget.flush_edits()
         # Reset the interruption setting
         self.lower_interruption()
         # Save the func kwargs
@@ -484,22 +491,27 @@ class Action_func_widget(QFrame):
 
     def show_func_params(self):
         sm = self._submodel
-        ce = Fractal_code_editor(self)
+        self._param_widget.flush_edits()
+        ce = self._params_editor
+        if ce is None:
+            ce = self._params_editor = Fractal_code_editor(self)
+            ce.setWindowTitle("Parameters")
         str_assign = fs.gui.guitemplates.script_assignments(sm.getkwargs())
-        
-        
         ce.set_text(str_assign)
-        ce.setWindowTitle("Parameters")
         ce.show()
+        ce.raise_()
 
 
     def show_script(self):
         """ Display the script in GUI """
+        self._param_widget.flush_edits()
         sm = self._submodel
         script = sm.getscript()
-        ce = Fractal_code_editor()
+        ce = self._script_editor
+        if ce is None:
+            ce = self._script_editor = Fractal_code_editor()
+            ce.setWindowTitle("Script")
         ce.set_text(script)
-        ce.setWindowTitle("Script")
         ce.exec()
 
 
@@ -599,6 +611,9 @@ class Collapsible_Param_Box(Param_Box):
         """
         super().__init__(title, parent)
         self.anim = QPropertyAnimation(self.content_area, b"maximumHeight")
+        # Optional callable filling the content area, deferred until the box
+        # is first expanded
+        self.content_builder = None
 
 
     def make_label(self, title):
@@ -651,6 +666,10 @@ class Collapsible_Param_Box(Param_Box):
             Qt.ArrowType.DownArrow if checked else Qt.ArrowType.RightArrow
         )
 
+        if checked and (self.content_builder is not None):
+            builder, self.content_builder = self.content_builder, None
+            builder()
+
         if checked:
             start = 0 # self.content_area.maximumHeight()
             end = self.gridLayout.sizeHint().height()
@@ -683,13 +702,22 @@ class Func_widget(QFrame):
         super().__init__(parent)
         self._model = func_smodel._model
         self._func_keys = func_smodel._keys
+        self._n_event_keys = len(self._func_keys) + 1
         self._submodel = func_smodel# model[func_keys]
         self._widgets = dict() # Will store references to the widgets that can
                                # be programmatically updated 
-
-        # Components and layout
+        self._stacks = dict() # i_param -> QStackedWidget for Union types
+        # Font shared by all parameter name labels
+        self._label_font = QtGui.QFont()
+        self._label_font.setWeight(QtGui.QFont.Weight.ExtraBold)
+
+        # Components and layout - updates are suspended during construction
+        # so that only a single geometry pass is triggered
+        self.setUpdatesEnabled(False)
         self._layout = QGridLayout(self)
         self.layout()
+        self.setUpdatesEnabled(True)
+        self.updateGeometry()
         # Publish / subscribe signals with the submodel
         self.func_user_modified.connect(self._submodel.func_user_modified_slot)
         self._model.model_event.connect(self.model_event_slot)
@@ -733,11 +761,22 @@ class Func_widget(QFrame):
                 current_layout = box.gridLayout
                 current_layout_row = 1
                 main_layout_row += 1
+                # The editors of a collapsed block are only built when the
+                # block is first expanded
+                lazy_params = []
+                box.content_builder = functools.partial(
+                    self.layout_params, lazy_params, current_layout
+                )
 
             else:
                 # adding a parameter editor to the current block layout,
                 # or directly the main layout box
-                self.layout_param(i_param, current_layout, current_layout_row)
+                if isinstance(box, Collapsible_Param_Box):
+                    lazy_params.append((i_param, current_layout_row))
+                else:
+                    self.layout_param(
+                        i_param, current_layout, current_layout_row
+                    )
                 current_layout_row += 1
                 if (current_layout is self._layout):
                     raise ValueError()
@@ -752,6 +791,14 @@ class Func_widget(QFrame):
         self._layout.setColumnStretch(2, 0)
 
 
+    def layout_params(self, params, layout):
+        """ Adds the editors for a list of (i_param, layout_row) """
+        self.setUpdatesEnabled(False)
+        for (i_param, layout_row) in params:
+            self.layout_param(i_param, layout, layout_row)
+        self.setUpdatesEnabled(True)
+
+
     def layout_separator(self, i_param, layout, layout_row):
         """ Adds a separator to the main layout - Returns a handle to the
         separator area sublayout """
@@ -779,9 +826,7 @@ class Func_widget(QFrame):
         
         name = fd[(i_param, "name")]
         name_label = QLabel(name)
-        myFont = QtGui.QFont()
-        myFont.setWeight(QtGui.QFont.Weight.ExtraBold)
-        name_label.setFont(myFont)
+        name_label.setFont(self._label_font)
         layout.addWidget(name_label, layout_row, 0, 1, 1)
 
         # Handles Union types
@@ -791,54 +836,57 @@ class Func_widget(QFrame):
                 QSizePolicy.Policy.Minimum
         )
         n_uargs = fd[(i_param, "n_types")]
+        type_sel = fd[(i_param, "type_sel")]
         if n_uargs == 0:
             utype = fd[(i_param, 0, "type")]
             utype_label = QLabel(type_name(utype))
             layout.addWidget(utype_label, layout_row, 2, 1, 1)
-            self.layout_uarg(qs, i_param, 0)
+            self.layout_uarg(qs, i_param, 0, utype)
         else:
             utypes = [fd[(i_param, utype, "type")] for utype in range(n_uargs)]
             utypes_combo = self._widgets[(i_param, "type_sel")] = QComboBox()
             self._widgets[(i_param, 'qs_type_sel')] = utypes_combo
             utypes_combo.addItems(type_name(t) for t in utypes)
-            utypes_combo.setCurrentIndex(fd[(i_param, "type_sel")])
-            utypes_combo.activated.connect(functools.partial(
-                self.on_user_mod, (i_param, "type_sel"),
-                utypes_combo.currentIndex
-            ))
+            utypes_combo.setCurrentIndex(type_sel)
+            utypes_combo.setProperty("func_key", (i_param, "type_sel"))
+            utypes_combo.activated.connect(self.on_type_sel_mod)
             # Connect to the QS
-            utypes_combo.currentIndexChanged[int].connect(qs.setCurrentIndex)
+            self._stacks[i_param] = qs
+            utypes_combo.currentIndexChanged[int].connect(
+                self.on_type_sel_changed
+            )
 
-            self._layout.addWidget(utypes_combo, layout_row, 2, 1, 1)
-            for utype in range(n_uargs):
-                self.layout_uarg(qs, i_param, utype)
+            layout.addWidget(utypes_combo, layout_row, 2, 1, 1)
+            # Only the selected Union member editor is built now, the others
+            # hold a placeholder until first selected
+            for i_union, utype in enumerate(utypes):
+                if i_union == type_sel:
+                    self.layout_uarg(qs, i_param, i_union, utype)
+                else:
+                    qs.addWidget(QWidget())
 
         # The displayed item of the union is denoted by "type_sel" :
         # self.layout_uarg(qs, i_param, fd[(i_param, "type_sel")])
-        qs.setCurrentIndex(fd[(i_param, "type_sel")])
+        qs.setCurrentIndex(type_sel)
         layout.addWidget(qs, layout_row, 1, 1, 1)
-        layout.setRowStretch(layout_row, 0)
 
 
     
-    def layout_uarg(self, qs, i_param, i_union):
-
-        fd = self._submodel._dict
-        # n_uargs = fd[(i_param, "n_types")]
-        utype = fd[(i_param, i_union, "type")]
-        uval = fd[(i_param, i_union, "val")]
+    def layout_uarg(self, qs, i_param, i_union, utype):
+        """ Adds the editor for the Union member `i_union` of type `utype`
+        """
+        key = (i_param, i_union, "val")
+        uval = self._submodel._dict[key]
         atom_wget = atom_wget_factory(utype)(utype, uval, self._model)
-        self._widgets[(i_param, i_union, "val")] = atom_wget
+        self._widgets[key] = atom_wget
 
-        atom_wget.user_modified.connect(functools.partial(
-                self.on_user_mod, (i_param, i_union, "val"),
-                atom_wget.value)
-        )
-        qs.addWidget(atom_wget)
+        atom_wget.setProperty("func_key", key)
+        atom_wget.user_modified.connect(self.on_atom_mod)
+        qs.insertWidget(i_union, atom_wget)
         
         if isinstance(atom_wget, Atom_Presenter_mixin):
             atom_wget.request_presenter.connect(functools.partial(
-                self.on_presenter, (i_param, i_union, "val")))
+                self.on_presenter, key))
 
 
     def reset_layout(self):
@@ -852,15 +900,46 @@ class Func_widget(QFrame):
                 # w.deleteLater() 
 # https://stackoverflow.com/questions/41053306/removing-a-widget-from-its-wxpython-parent
 
-    def on_user_mod(self, key, val_callback, *args):
-        """ Notify the model of modification by the user of a widget"""
-        val = val_callback()
-        self.func_user_modified.emit(key, val)
+    def flush_edits(self):
+        """ Pushes to the model the text edits still being debounced """
+        for wget in self._widgets.values():
+            if isinstance(wget, Atom_QPlainTextEdit):
+                wget.flush()
+
+    @pyqtSlot(int)
+    def on_type_sel_mod(self, index):
+        """ Notify the model of a Union type selection by the user """
+        key = self.sender().property("func_key")
+        self.func_user_modified.emit(key, index)
+
+    @pyqtSlot(int)
+    def on_type_sel_changed(self, index):
+        """ Shows the Union member editor `index`, building it if needed """
+        i_param, _ = self.sender().property("func_key")
+        qs = self._stacks[i_param]
+        if (i_param, index, "val") not in self._widgets:
+            placeholder = qs.widget(index)
+            utype = self._submodel._dict[(i_param, index, "type")]
+            self.layout_uarg(qs, i_param, index, utype)
+            qs.removeWidget(placeholder)
+            placeholder.deleteLater()
+        qs.setCurrentIndex(index)
 
+    @pyqtSlot()
+    def on_atom_mod(self):
+        """ Notify the model of modification by the user of an atom widget
+        """
+        atom_wget = self.sender()
+        self.func_user_modified.emit(
+            atom_wget.property("func_key"), atom_wget.value()
+        )
+
+    @pyqtSlot(object, object)
     def model_event_slot(self, keys, val):
         """ Handles modification of widget triggered from model """
         # Does the event impact one of my child widgets ? otherwise, return
-        if keys[:-1] != self._func_keys:
+        # (cheap length test first, most events are for other submodels)
+        if (len(keys) != self._n_event_keys) or (keys[:-1] != self._func_keys):
             return # This is not for this Func_widget
         key = keys[-1]
         try:
@@ -869,9 +948,14 @@ class Func_widget(QFrame):
             # Not a widget, probably a parameter default signal
             return
 
-        # Check first Atom_Mixin
+        # Check first Atom_Mixin - these block their own signals
         if isinstance(wget, Atom_Edit_mixin):
             wget.on_model_event(val)
+        elif isinstance(wget, QComboBox):
+            # Union type selector: not blocked, the QStackedWidget follows
+            # currentIndexChanged, and `activated` is only emitted for user
+            # interactions so nothing is echoed back to the model
+            wget.setCurrentIndex(val)
         else:
             raise NotImplementedError(
                 f"Func_widget.model_event_slot {wget}"
@@ -915,25 +999,17 @@ class Func_widget(QFrame):
                 dock_widget.raise_()
 
 def atom_wget_factory(atom_type):
+    # Fast path for the concrete types, see ATOM_WGET_DIC
+    wget = ATOM_WGET_DIC.get(atom_type)
+    if wget is not None:
+        return wget
     if typing.get_origin(atom_type) is typing.Literal:
         return Atom_QComboBox
     elif issubclass(atom_type, fs.Fractal): 
         return Atom_fractal_button
     elif issubclass(atom_type, fs.numpy_utils.Numpy_expr):
         return Atom_QLineEdit
-    else:
-        wget_dic = {
-            int: Atom_QLineEdit,
-            float: Atom_QLineEdit,
-            str: Atom_QLineEdit,
-            bool: Atom_QCheckBox, # Atom_QBoolComboBox
-            mpmath.mpf: Atom_QPlainTextEdit,
-            fs.colors.Color: Atom_Color,
-            fs.colors.Fractal_colormap: Atom_cmap_button,
-            fs.colors.Blinn_lighting: Atom_lighting_button,
-            type(None): Atom_QLineEdit
-        }
-        return wget_dic[atom_type]
+    raise KeyError(atom_type)
 
 
 class Atom_Edit_mixin:
@@ -957,6 +1033,7 @@ class Atom_QCheckBox(QCheckBox, Atom_Edit_mixin):
     def value(self):
         return self.isChecked()
 
+    @pyqtSlot()
     def on_user_event(self):
         self.user_modified.emit()
 
@@ -992,6 +1069,7 @@ class Atom_QBoolComboBox(QComboBox, Atom_Edit_mixin, NoWheel_mixin):
     def value(self):
         return self._values[self.currentIndex()]
 
+    @pyqtSlot()
     def on_user_event(self):
         self.user_modified.emit()
 
@@ -1012,11 +1090,13 @@ class Atom_Color(QPushButton, Atom_Edit_mixin):
         self._type = atom_type
         self._kind = {3: "rgb", 4: "rgba"}[len(val)]
         self._qcolor = None
-        self.update_color(val)
+        self._colord = None # QColorDialog, created on first use
+        self.update_color(val, from_user=False)
         self.clicked.connect(self.on_user_event)
 
-    def update_color(self, color):
-        """ color: QtGui.QColor or fs.colors.Color """
+    def update_color(self, color, from_user=True):
+        """ color: QtGui.QColor or fs.colors.Color
+        user_modified is only emitted for user-driven changes """
         if isinstance(color, QtGui.QColor):
             qcolor = color
         else:
@@ -1049,7 +1129,8 @@ class Atom_Color(QPushButton, Atom_Edit_mixin):
                 self.setGraphicsEffect(effect)
 
             self.repaint()
-            self.user_modified.emit()
+            if from_user:
+                self.user_modified.emit()
 
     def value(self):
         c = self._qcolor
@@ -1059,23 +1140,28 @@ class Atom_Color(QPushButton, Atom_Edit_mixin):
             ret = (c.redF(), c.greenF(), c.blueF(), c.alphaF())
         return ret
 
+    @pyqtSlot()
     def on_user_event(self):
-        colord = QColorDialog()
-        colord.setOption(QColorDialog.ColorDialogOption.DontUseNativeDialog)
-        if self._kind == "rgba":
-            colord.setOption(QColorDialog.ColorDialogOption.ShowAlphaChannel)
+        colord = self._colord
+        if colord is None:
+            # Not parented: the button stylesheet would cascade to it
+            colord = self._colord = QColorDialog()
+            colord.setOption(
+                QColorDialog.ColorDialogOption.DontUseNativeDialog
+            )
+            if self._kind == "rgba":
+                colord.setOption(
+                    QColorDialog.ColorDialogOption.ShowAlphaChannel
+                )
         colord.setCurrentColor(self._qcolor)
         colord.setCustomColor(0, self._qcolor)
-        colord.currentColorChanged.connect(self.update_color)
-        old_col = self._qcolor
+        # The model is only notified of the accepted color
         if colord.exec():
             self.update_color(colord.currentColor())
-        else:
-            self.update_color(old_col)
 
     def on_model_event(self, val):
         with QtCore.QSignalBlocker(self):
-            self.update_color(val)
+            self.update_color(val, from_user=False)
 
 
 class Atom_QLineEdit(QLineEdit, Atom_Edit_mixin): 
@@ -1105,6 +1191,7 @@ class Atom_QLineEdit(QLineEdit, Atom_Edit_mixin):
 
         return self._type(self.text())
 
+    @pyqtSlot()
     def on_user_event(self):
         self.user_modified.emit()
 
@@ -1113,6 +1200,7 @@ class Atom_QLineEdit(QLineEdit, Atom_Edit_mixin):
             self.setText(str(val))
             self.validate(self.text(), acceptable_color="#25272C")
 
+    @pyqtSlot(str)
     def validate(self, text, acceptable_color="#c8c8c8"):
         validator = self.validator()
         if validator is not None:
@@ -1139,15 +1227,74 @@ class Atom_QPlainTextEdit(QPlainTextEdit, Atom_Edit_mixin):
         self.setWordWrapMode(QtGui.QTextOption.WrapMode.WrapAnywhere)
         self.setStyleSheet(PLAIN_TEXT_EDIT_CSS.format("#25272C"))
 
+        self._bg_color = "#25272C"
         self._validator = Atom_Text_Validator(atom_type, val)
+        self.update_metrics()
+
+        # Validation (mpf parsing) and model update are deferred until the
+        # user pauses typing - or until a pending edit is flushed
+        self._debounce = QtCore.QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(80)
+        self._debounce.timeout.connect(self.validate)
 
         # signals / slots
-        self.textChanged.connect(self.validate)
+        self.textChanged.connect(self.on_text_changed)
+
+    @pyqtSlot()
+    def on_text_changed(self):
+        """ Immediate lexical pre-check for the background color, the full
+        validation follows when the debounce timer fires """
+        if MPF_DECIMAL_RE.fullmatch(self.toPlainText()) is None:
+            self.set_background("#dc4646")
+        else:
+            self.set_background("#25272C")
+        self._debounce.start()
+
+    def flush(self):
+        """ Validates now a pending edit, if any """
+        if self._debounce.isActive():
+            self._debounce.stop()
+            self.validate()
+
+    def focusOutEvent(self, event):
+        self.flush()
+        super().focusOutEvent(event)
+
+    def hideEvent(self, event):
+        self.flush()
+        super().hideEvent(event)
+
+    def set_background(self, color):
+        """ Sets the background color - only if modified """
+        if color != self._bg_color:
+            self._bg_color = color
+            self.setStyleSheet(PLAIN_TEXT_EDIT_CSS.format(color))
 
     def value(self):
         return self.toPlainText()
 
+    def update_metrics(self):
+        """ Caches the font-dependant row height and the vertical margins
+        used to size the widget to its content """
+        self._row_height = QtGui.QFontMetricsF(self.font()).lineSpacing()
+        self._margins = (
+            self.contentsMargins().top()
+            + self.contentsMargins().bottom()
+            + 2 * self.document().rootFrame().frameFormat().margin()
+            + 2
+        )
+
+    def changeEvent(self, event):
+        if event.type() in (
+            QtCore.QEvent.Type.FontChange,
+            QtCore.QEvent.Type.StyleChange
+        ):
+            self.update_metrics()
+        super().changeEvent(event)
+
     def on_model_event(self, val):
+        self._debounce.stop()
         with QtCore.QSignalBlocker(self):
             str_val = val
             if str_val != self.toPlainText():
@@ -1156,6 +1303,7 @@ class Atom_QPlainTextEdit(QPlainTextEdit, Atom_Edit_mixin):
                     self.setPlainText(str_val)
             self.validate(from_user=False)
 
+    @pyqtSlot()
     def validate(self, from_user=True):
         """ Sets background color according to the text validation
         """
@@ -1164,13 +1312,11 @@ class Atom_QPlainTextEdit(QPlainTextEdit, Atom_Edit_mixin):
         if validator is not None:
             ret, _, _ = validator.validate(text, self.pos())
             if ret == QtGui.QValidator.State.Acceptable:
-                self.setStyleSheet(PLAIN_TEXT_EDIT_CSS.format(
-                       "#25272C"))
+                self.set_background("#25272C")
                 if from_user:
                     self.user_modified.emit()
             else:
-                self.setStyleSheet(PLAIN_TEXT_EDIT_CSS.format(
-                       "#dc4646"))
+                self.set_background("#dc4646")
             cursor = QtGui.QTextCursor(self.document())
             cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
 
@@ -1178,14 +1324,10 @@ class Atom_QPlainTextEdit(QPlainTextEdit, Atom_Edit_mixin):
         """ Adjust widget size to its text content
         ref: https://doc.qt.io/qt-5/qplaintextdocumentlayout.html
         """
-        doc = self.document()
-        nrows = doc.lineCount()
-        row_height = QtGui.QFontMetricsF(self.font()).lineSpacing()
-        margins = (self.contentsMargins().top()
-                   + self.contentsMargins().bottom()
-                   + 2 * doc.rootFrame().frameFormat().margin()
-                   + 2)
-        doc_height = int(row_height * nrows + margins)
+        # Only the line count is queried here: it depends on the wrapping
+        # i.e. on the current width, and is up-to-date at paint time
+        nrows = self.document().lineCount()
+        doc_height = int(self._row_height * nrows + self._margins)
         if self.height() != doc_height:
             self.adjust_size(doc_height)
         else:
@@ -1219,6 +1361,7 @@ class Atom_QComboBox(QComboBox, Atom_Edit_mixin, NoWheel_mixin):
     def value(self):
         return self.currentIndex()
 
+    @pyqtSlot()
     def on_user_event(self):
         self.user_modified.emit()
 
@@ -1252,6 +1395,9 @@ class Qobject_image(QWidget):
     def __init__(self, parent, img_object, minwidth=200, height=20):
         super().__init__(parent)
         self._object = img_object
+        # Last rendered image, reused until the object or the size changes
+        self._img = None
+        self._img_size = None
         self.setMinimumWidth(minwidth)
         self.setMinimumHeight(height)
         self.setMaximumHeight(height)
@@ -1260,10 +1406,20 @@ class Qobject_image(QWidget):
                 QSizePolicy.Policy.Expanding
         )
 
+    def update_object(self, img_object):
+        """ Sets the displayed object - also to be called after an in-place
+        modification of the current object """
+        self._object = img_object
+        self._img = None
+        self.repaint()
+
     def paintEvent(self, evt):
         size = self.size()
         nx, ny = size.width(), size.height()
-        QtGui.QPainter(self).drawImage(0, 0, self._object.output_ImageQt(nx, ny))
+        if (self._img is None) or (self._img_size != (nx, ny)):
+            self._img = self._object.output_ImageQt(nx, ny)
+            self._img_size = (nx, ny)
+        QtGui.QPainter(self).drawImage(0, 0, self._img)
 
 
 class Atom_cmap_button(Qobject_image, Atom_Edit_mixin, Atom_Presenter_mixin):
@@ -1277,8 +1433,7 @@ class Atom_cmap_button(Qobject_image, Atom_Edit_mixin, Atom_Presenter_mixin):
 
     def update_cmap(self, cmap):
         """ cmap: fs.color.Fractal_colormap """
-        self._object = cmap
-        self.repaint()
+        self.update_object(cmap)
         # Note : we do not emit self.user_modified, this shall be done at
         # Qcmap_editor widget level
 
@@ -1305,8 +1460,10 @@ class Atom_lighting_button(Qobject_image, Atom_Edit_mixin, Atom_Presenter_mixin)
     def update_lighting(self, lighting):
         """ cmap: fs.color.Fractal_colormap """
         if lighting != self._object:
-            self._object = lighting
-            self.repaint()
+            self.update_object(lighting)
+        else:
+            # Might have been modified in-place, will show at next paint
+            self._img = None
             # Note : we do not emit self.user_modified, this shall be done at
             # Qcmap_editor widget level
 
@@ -1321,6 +1478,24 @@ class Atom_lighting_button(Qobject_image, Atom_Edit_mixin, Atom_Presenter_mixin)
         self.request_presenter.emit(Lighting_presenter, Qlighting_editor)
 
 
+# Editor widget class for each concrete atom type, used by atom_wget_factory
+ATOM_WGET_DIC = {
+    int: Atom_QLineEdit,
+    float: Atom_QLineEdit,
+    str: Atom_QLineEdit,
+    bool: Atom_QCheckBox, # Atom_QBoolComboBox
+    mpmath.mpf: Atom_QPlainTextEdit,
+    fs.colors.Color: Atom_Color,
+    fs.colors.Fractal_colormap: Atom_cmap_button,
+    fs.colors.Blinn_lighting: Atom_lighting_button,
+    type(None): Atom_QLineEdit
+}
+
+
+# Plain decimal literal, always a valid mpmath.mpf string
+MPF_DECIMAL_RE = re.compile(r"[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?")
+
+
 class Atom_Text_Validator(QtGui.QValidator):
 
     def __init__(self, atom_type, val):
@@ -1343,6 +1518,10 @@ class Atom_Text_Validator(QtGui.QValidator):
                 val,
                 pos
             )
+        if (self._type is mpmath.ctx_mp_python.mpf
+                and MPF_DECIMAL_RE.fullmatch(val) is not None):
+            # Fast path, avoids an arbitrary precision parse at each keystroke
+            return (valid[True], val, pos)
         try:
             casted = self._type(val)
         except ValueError:
@@ -1367,8 +1546,9 @@ class ColorDelegate(QStyledItemDelegate):
     def createEditor(self, parent, option, index):
         dialog = QColorDialog(None) #
         dialog.setOption(QColorDialog.ColorDialogOption.DontUseNativeDialog)
-        dialog.setCurrentColor(index.data(Qt.ItemDataRole.BackgroundRole))
-        dialog.setCustomColor(0, index.data(Qt.ItemDataRole.BackgroundRole))
+        color = index.data(Qt.ItemDataRole.BackgroundRole)
+        dialog.setCurrentColor(color)
+        dialog.setCustomColor(0, color)
         # QT doc: The returned editor widget should have Qt::StrongFocus
         dialog.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         dialog.setFocusProxy(parent)
@@ -1695,9 +1875,7 @@ class Base_array_editor(QWidget):
                 delegates.append(ColorDelegate)
                 delegates_options.append(None)
                 roles.append(bgr)
-                val_funcs.append(
-                        lambda v: QtGui.QColor(*list(int(255 * f) for f in v))
-                )
+                val_funcs.append(lambda v: QtGui.QColor.fromRgbF(*v))
                 row_ranges_func.append(lambda l: l)
 
             elif is_class and issubclass(item_type, fs.numpy_utils.Numpy_expr):
@@ -1814,6 +1992,9 @@ class Base_array_editor(QWidget):
 
     def populate_table(self):
         # Signals shall be temporarly blocked to avoid infinite event loop.
+        # Repaints are suspended so that the view refreshes once, after all
+        # the cells have been set.
+        self._table.setUpdatesEnabled(False)
         with QtCore.QSignalBlocker(self._table):
             n_rows =  self._presenter.n_rows
             self._table.setRowCount(n_rows)
@@ -1830,6 +2011,7 @@ class Base_array_editor(QWidget):
                     val_func=self.col_val_funcs[icol],
                     flags=self.std_flags
                 )
+        self._table.setUpdatesEnabled(True)
 
     def populate_column(self, col, row_range, role, tab, old_tab,
                         val_func, flags=None):
@@ -1884,9 +2066,7 @@ class Base_array_editor(QWidget):
                 # No validation needed, as values are selected programmatically
                 validated = True
                 # QColor to arrray concersion
-                item_data = [
-                    item_data.redF(), item_data.greenF(), item_data.blueF()
-                ]
+                item_data = item_data.getRgbF()[:3]
             else:
                 # Need delegate validation
                 delegate = self._table.itemDelegateForColumn(col)
@@ -1914,6 +2094,7 @@ class Base_array_editor(QWidget):
         else:
             raise ValueError(source)
 
+    @pyqtSlot(object, object)
     def model_event_slot(self, keys, val):
         if keys == self._presenter._mapping[self.presenter_classname]:
             # Sets the value of the sub-widgets according to the smodel
@@ -1989,8 +2170,7 @@ class Qcmap_editor(Base_array_editor):
         super().populate_param_box()
         val_extent = self.extent_choices.index(self._cmap.extent)
         self._wget_extent.setCurrentIndex(val_extent)
-        self._preview._object = self._cmap
-        self._preview.repaint()
+        self._preview.update_object(self._cmap)
 
     def populate_table(self):
         """ Customizing the table with a frozen last row... """
@@ -2071,9 +2251,10 @@ class Qlighting_editor(Base_array_editor):
     def populate_param_box(self):
         super().populate_param_box()
         self._wget_k_ambient.setText(str(self._lighting.k_ambient))
-        self._wget_color_ambient.update_color(self._lighting.color_ambient)
-        self._preview._object = self._lighting
-        self._preview.repaint()
+        self._wget_color_ambient.update_color(
+            self._lighting.color_ambient, from_user=False
+        )
+        self._preview.update_object(self._lighting)
 
 
     def on_user_mod(self, source, val_callback):
@@ -2202,6 +2383,7 @@ class Fractal_editor(QWidget):
         self.data_user_modified.emit(pname, wget_val)
 
 
+    @pyqtSlot(object, object)
     def model_event_slot(self, keys, val):
         if keys == self._presenter._mapping["Fractal_presenter"]:
             self.update_param_box(val)
@@ -2252,34 +2434,39 @@ class QDict_viewer(QWidget):
         """
         Clears and reset all child widgets
         """
+        self.setUpdatesEnabled(False)
         self._del_ranges()
         self._qdict = qdict
-        self._key_row = dict()
+        self._key_row = dict() # key -> (key label, value label)
         row = 0
         for k, v in qdict.items(): #kwargs_dic.items():
-            self._layout.addWidget(QLabel(k), row, 0, 1, 1)
-            self._layout.addWidget(QLabel(str(v)), row, 1, 1, 1)
-            self._key_row[k] = row
+            key_label = QLabel(k)
+            val_label = QLabel(str(v))
+            self._layout.addWidget(key_label, row, 0, 1, 1)
+            self._layout.addWidget(val_label, row, 1, 1, 1)
+            self._key_row[k] = (key_label, val_label)
             row += 1
+        self.setUpdatesEnabled(True)
 
     def values_update(self, update_dic):
         """
         Updates in-place with update_dic values
         """
         for k, v in update_dic.items():
-            row = self._key_row[k]
-            widget = self._layout.itemAtPosition(row, 1).widget()
-            if widget is not None:
-                self._qdict[k] = v
-                widget.setText(str(v))
+            _, widget = self._key_row[k]
+            self._qdict[k] = v
+            text = str(v)
+            # Typically px / py, often unchanged between mouse samples
+            if text != widget.text():
+                widget.setText(text)
 
     def _del_ranges(self):
         """ Delete every item in self._layout """
-        for i in reversed(range(self._layout.count())): 
-            w = self._layout.itemAt(i).widget()
+        while (item := self._layout.takeAt(0)) is not None:
+            w = item.widget()
             if w is not None:
-                w.setParent(None)
-                # w.deleteLater()
+                w.hide()
+                w.deleteLater()
 
 #==============================================================================
 # Graphics Scene classes
@@ -2289,10 +2476,17 @@ class Zoomable_Drawer_mixin:
     Commom methods that allow to wheel-zoom, and draw objects
     Pass mouse position (self._object_pos, self._object_drag) to the subclasses
     """
+    # Pens for the objects being drawn (solid underlay + dotted overlay)
+    under_pen = QtGui.QPen(QtGui.QColor("red"), 0, Qt.PenStyle.SolidLine)
+    over_pen = QtGui.QPen(QtGui.QColor("black"), 0, Qt.PenStyle.DotLine)
+
     def __init__(self):
         """ Initiate a GaphicsScene """
         # sets graphics scene and view
         self._scene = QGraphicsScene()
+        # Only a handful of items: a spatial index is pure overhead, as it
+        # would be updated at each move of the selection rect or line
+        self._scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
         self._group = QGraphicsItemGroup()
         self._view = QGraphicsView()
         self._scene.addItem(self._group)
@@ -2303,6 +2497,22 @@ class Zoomable_Drawer_mixin:
         self._object_pos = tuple() # No coords
         self._object_drag = None
         self._drawing = False
+
+        # Mouse moves are coalesced: the last position is processed at most
+        # once every 16 ms (~ 60 Hz)
+        self._mouse_pos = None
+        self._mouse_timer = QtCore.QTimer(self._view)
+        self._mouse_timer.setSingleShot(True)
+        self._mouse_timer.setInterval(16)
+        self._mouse_timer.timeout.connect(self.flush_mouse_move)
+
+        # Same for wheel events: the zoom factors are accumulated and applied
+        # in a single `scale` call
+        self._wheel_factor = 1.
+        self._wheel_timer = QtCore.QTimer(self._view)
+        self._wheel_timer.setSingleShot(True)
+        self._wheel_timer.setInterval(16)
+        self._wheel_timer.timeout.connect(self.flush_wheel)
         
         # zooms anchors for wheel events - note this is only active 
         # when the image fully occupies the widget
@@ -2312,6 +2522,9 @@ class Zoomable_Drawer_mixin:
                 QGraphicsView.ViewportAnchor.AnchorUnderMouse)
         self._view.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
+        if fs.settings.GUI_opengl_viewport:
+            self.set_opengl_viewport()
+
         # events filters
         self._view.viewport().installEventFilter(self)
         self._scene.installEventFilter(self)
@@ -2319,6 +2532,23 @@ class Zoomable_Drawer_mixin:
         # Locker
         self._lock = 0
 
+        # (image rect, viewport size, view transform) after the last
+        # fit_image, used to skip redundant fits
+        self._last_fit = None
+
+    def set_opengl_viewport(self):
+        """ Renders the view through an OpenGL viewport, if available """
+        try:
+            from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+        except ImportError as e:
+            logger.warning(f"OpenGL viewport not available, skipped: {e}")
+            return
+        self._view.setViewport(QOpenGLWidget())
+        # Partial updates are not reliable with an OpenGL viewport
+        self._view.setViewportUpdateMode(
+            QGraphicsView.ViewportUpdateMode.FullViewportUpdate
+        )
+
     # Activates / desactivates locking ========================================
     @pyqtSlot(bool)
     def lock(self, val):
@@ -2361,21 +2591,27 @@ class Zoomable_Drawer_mixin:
         return False
 
     def on_wheel(self, event):
-        """
-        - Updates the zoom
-        - Send the current zoom value to `pos_tracker` if exists 
-        """
+        """ Accumulates the zoom factor, applied at next `flush_wheel` """
         if self._qim is not None:
-            view = self._view
             if event.angleDelta().y() > 0:
-                factor = 1.25
+                self._wheel_factor *= 1.25
             else:
-                factor = 0.8
-            view.scale(factor, factor)
-            if hasattr(self, "pos_tracker"):
-                self.pos_tracker(kind="zoom", val=self.zoom)
+                self._wheel_factor *= 0.8
+            if not self._wheel_timer.isActive():
+                self._wheel_timer.start()
         return True
 
+    def flush_wheel(self):
+        """
+        - Updates the zoom
+        - Send the current zoom value to `pos_tracker` if exists 
+        """
+        factor = self._wheel_factor
+        self._wheel_factor = 1.
+        self._view.scale(factor, factor)
+        if hasattr(self, "pos_tracker"):
+            self.pos_tracker(kind="zoom", val=self.zoom)
+
     @property
     def zoom(self):
         view = self._view
@@ -2387,6 +2623,11 @@ class Zoomable_Drawer_mixin:
         if self._qim is None:
             return
         rect = QtCore.QRectF(self._qim.pixmap().rect())
+        view = self._view
+        fit_state = (rect, view.viewport().size(), view.transform())
+        if fit_state == self._last_fit:
+            # Already fitted, and not zoomed since
+            return
         if not rect.isNull():
             # always scrollbars off
             self._view.setVerticalScrollBarPolicy(
@@ -2416,6 +2657,8 @@ class Zoomable_Drawer_mixin:
             if hasattr(self, "pos_tracker"):
                 self.pos_tracker(kind="zoom", val=self.zoom)
 
+            self._last_fit = (rect, view.viewport().size(), view.transform())
+
 
     def on_viewport_mouse(self, event):
 
@@ -2466,14 +2709,21 @@ class Zoomable_Drawer_mixin:
 
 
     def on_mouse_move(self, event):
+        """ Stores the position, processed at next `flush_mouse_move` """
+        self._mouse_pos = event.scenePos()
+        if not self._mouse_timer.isActive():
+            self._mouse_timer.start()
+
+    def flush_mouse_move(self):
         """ 
         - Publish the position to a pos tracker if exists 
         - If object is being drawn, send a draw_object
         """
+        pos = self._mouse_pos
         if hasattr(self, "pos_tracker"):
-            self.pos_tracker(kind="pos", val=event.scenePos())
+            self.pos_tracker(kind="pos", val=pos)
         if self._drawing:
-            self._object_drag = event.scenePos()
+            self._object_drag = pos
             self.draw_object()
 
     def publish_object(self):
@@ -2508,6 +2758,8 @@ class Image_widget(QWidget, Zoomable_Drawer_mixin):
 
         self._model = view_presenter._model
         self._mapping = view_presenter._mapping
+        # Reverse mapping model keys -> mapping key, for `model_event_slot`
+        self._rev_mapping = {v: k for (k, v) in self._mapping.items()}
         self._presenter = view_presenter
         
         # Need dps ?
@@ -2536,9 +2788,11 @@ class Image_widget(QWidget, Zoomable_Drawer_mixin):
         self._rect= None
         self._rect_under = None
         self.object_max_pts = 2
+        self._ratio_coeffs = None # (xy_ratio, selection rect coefficient)
 
         # Sets Image
         self._qim = None
+        self._image_header_cache = None
         self.set_zoom_init(try_reload=True)
         self.set_im()
         
@@ -2741,6 +2995,27 @@ class Image_widget(QWidget, Zoomable_Drawer_mixin):
         )
 
 
+    def image_header(self, image_file):
+        """ Returns the (info, size) of a png image file. The last result is
+        cached, keyed by file path and modification time """
+        key = (image_file, os.path.getmtime(image_file))
+        cached = self._image_header_cache
+        if (cached is None) or (cached[0] != key):
+            # Only parses the header, pixel data is not decoded
+            with PIL.Image.open(image_file) as im:
+                cached = self._image_header_cache = (key, im.info, im.size)
+        return cached[1:]
+
+    def image_pixmap(self, image_file):
+        """ Returns the QPixmap of a png image file, through the global
+        QPixmapCache keyed by file path and modification time """
+        key = "{}|{}".format(image_file, os.path.getmtime(image_file))
+        pixmap = QtGui.QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QtGui.QPixmap(image_file)
+            QtGui.QPixmapCache.insert(key, pixmap)
+        return pixmap
+
     def set_im(self):
         """
         This reloads the image and checks that the 
@@ -2750,9 +3025,7 @@ class Image_widget(QWidget, Zoomable_Drawer_mixin):
                                    self._presenter["image"] + ".png")
         valid_image = True
         try:
-            with PIL.Image.open(image_file) as im:
-                info = im.info
-                nx, ny = im.size
+            info, (nx, ny) = self.image_header(image_file)
 
         except FileNotFoundError:
             valid_image = False
@@ -2773,26 +3046,30 @@ class Image_widget(QWidget, Zoomable_Drawer_mixin):
             )
         self.validate()
 
-        for item in [self._qim, self._rect, self._rect_under]:
-            if item is not None:
-                self._group.removeFromGroup(item)
+        self.hide_drawing_rect()
 
         if valid_image:
-            self._qim = QGraphicsPixmapItem(
-                QtGui.QPixmap.fromImage(QtGui.QImage(image_file))
-            )
-            # Antialiasing activated :
-            self._qim.setTransformationMode(
-                Qt.TransformationMode.SmoothTransformation
-            )
-            self._qim.setAcceptHoverEvents(True)
-            self._group.addToGroup(self._qim)
+            # The pixmap item is created once, then only its pixmap changes
+            if self._qim is None:
+                self._qim = QGraphicsPixmapItem()
+                # Antialiasing activated :
+                self._qim.setTransformationMode(
+                    Qt.TransformationMode.SmoothTransformation
+                )
+                # The scaled pixmap is cached, panning is then a simple blit
+                self._qim.setCacheMode(
+                    QGraphicsItem.CacheMode.DeviceCoordinateCache
+                )
+                self._qim.setAcceptHoverEvents(True)
+                # Stays below the selection rectangle
+                self._qim.setZValue(-1.)
+                self._group.addToGroup(self._qim)
+            self._qim.setPixmap(self.image_pixmap(image_file))
             self.fit_image()
-        else:
+        elif self._qim is not None:
+            self._scene.removeItem(self._qim)
             self._qim = None
 
-        self._rect = None
-        self._rect_under = None
         self._drawing_rect = False
 
     @staticmethod
@@ -2857,13 +3134,13 @@ class Image_widget(QWidget, Zoomable_Drawer_mixin):
             if value is not None:
                 # Send a model modification request
                 self._presenter[key] = value
-        # Removes the objects
-        if self._rect is not None:
-            self._group.removeFromGroup(self._rect)
-            self._rect = None
-        if self._rect_under is not None:
-            self._group.removeFromGroup(self._rect_under)
-            self._rect_under = None
+        self.hide_drawing_rect()
+
+    def hide_drawing_rect(self):
+        """ Hides the selection rectangle, items are kept for reuse """
+        for item in (self._rect, self._rect_under):
+            if item is not None:
+                item.setVisible(False)
 
     def publish_object(self):
         """
@@ -2956,8 +3233,7 @@ class Image_widget(QWidget, Zoomable_Drawer_mixin):
         keys = self.editable_keys # Note that theta is not editable by mouse
         if self.has_dps:
             keys += ("dps",)
-        for key in keys:
-            self._presenter[key] = ref_zoom[key]
+        self._presenter.update({key: ref_zoom[key] for key in keys})
             
 
     def draw_object(self):
@@ -2974,15 +3250,16 @@ class Image_widget(QWidget, Zoomable_Drawer_mixin):
 
         rectF = QtCore.QRectF(topleft, bottomRight)
         if self._rect is not None:
-            self._rect.setRect(rectF)
-            self._rect_under.setRect(rectF)
+            for r in (self._rect_under, self._rect):
+                r.setRect(rectF)
+                r.setVisible(True)
         else:
             self._rect_under = QGraphicsRectItem(rectF)
-            self._rect_under.setPen(QtGui.QPen(QtGui.QColor("red"), 0, Qt.PenStyle.SolidLine))
+            self._rect_under.setPen(self.under_pen)
             self._group.addToGroup(self._rect_under)
 
             self._rect = QGraphicsRectItem(rectF)
-            self._rect.setPen(QtGui.QPen(QtGui.QColor("black"), 0, Qt.PenStyle.DotLine))
+            self._rect.setPen(self.over_pen)
             self._group.addToGroup(self._rect)
 
         # Now apply the rotation
@@ -2993,12 +3270,18 @@ class Image_widget(QWidget, Zoomable_Drawer_mixin):
     def selection_corners(self, pos0, pos1):
         """ These are the selection rectangle corners """
         # Enforce the correct ratio
-        diffx = abs(pos1.x() - pos0.x())
-        diffy = abs(pos1.y() - pos0.y())
-        # Enforce the correct ratio
-        radius_sq = diffx ** 2 + diffy ** 2
-        diffx0 = math.sqrt(radius_sq / (1. + 1. / self.xy_ratio ** 2))
-        diffy0 = diffx0 / self.xy_ratio
+        diffx = pos1.x() - pos0.x()
+        diffy = pos1.y() - pos0.y()
+        radius_sq = diffx * diffx + diffy * diffy
+        if self._ratio_coeffs is None:
+            # Cached until xy_ratio is modified (see model_event_slot)
+            xy_ratio = self.xy_ratio
+            self._ratio_coeffs = (
+                xy_ratio, 1. / math.sqrt(1. + 1. / xy_ratio ** 2)
+            )
+        xy_ratio, coeff = self._ratio_coeffs
+        diffx0 = math.sqrt(radius_sq) * coeff
+        diffy0 = diffx0 / xy_ratio
         topleft = QtCore.QPointF(pos0.x() - diffx0, pos0.y() - diffy0)
         bottomRight = QtCore.QPointF(pos0.x() + diffx0, pos0.y() + diffy0)
         return topleft, bottomRight
@@ -3011,14 +3294,17 @@ class Image_widget(QWidget, Zoomable_Drawer_mixin):
         )
         return theta_diff_deg
 
+    @pyqtSlot(object, object)
     def model_event_slot(self, keys, val):
         """ A model item has been modified - will it impact the widget ? """
         # Find the matching "mapping" - None if no match
-        mapped = next((k for k, v in self._mapping.items() if v == keys), None)
+        mapped = self._rev_mapping.get(keys)
         if mapped in ["image", "fractal"]:
             self.set_zoom_init()
             self.set_im()
-        elif mapped in ["x", "y", "dx", "xy_ratio", "theta_deg", "dps"]:
+        elif mapped == "xy_ratio":
+            self._ratio_coeffs = None
+        elif mapped in ["x", "y", "dx", "theta_deg", "dps"]:
             pass
         else:
             if mapped is not None:
@@ -3081,6 +3367,7 @@ class Cmap_Image_widget(QDialog, Zoomable_Drawer_mixin):
     def set_im(self):
         self._qim = QGraphicsPixmapItem(QtGui.QPixmap.fromImage(
                 QtGui.QImage(self.file_path)))
+        self._qim.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self._qim.setAcceptHoverEvents(True)
         self._group.addToGroup(self._qim)
         self.fit_image()
@@ -3306,11 +3593,11 @@ class Cmap_Image_widget(QDialog, Zoomable_Drawer_mixin):
             self._line_under.setLine(qlineF)
         else:
             self._line_under = QGraphicsLineItem(qlineF)
-            self._line_under.setPen(QtGui.QPen(QtGui.QColor("red"), 0, Qt.PenStyle.SolidLine))
+            self._line_under.setPen(self.under_pen)
             self._group.addToGroup(self._line_under)
 
             self._line = QGraphicsLineItem(qlineF)
-            self._line.setPen(QtGui.QPen(QtGui.QColor("black"), 0, Qt.PenStyle.DotLine))
+            self._line.setPen(self.over_pen)
             self._group.addToGroup(self._line)
 
 
@@ -3416,7 +3703,12 @@ class Fractal_MainWindow(QMainWindow):
     def __init__(self, gui):
         super().__init__(parent=None)
         self.setStyleSheet(MAIN_WINDOW_CSS)
+        # Default 10 MB limit (in kB) would not hold a single large image
+        QtGui.QPixmapCache.setCacheLimit(256 * 1024)
         self.build_model(gui)
+        # Registered objects do not change after `build_model`
+        self._image_presenter = self.from_register("image")
+        self._func_submodel = self.from_register(("func",))
         self.layout()
         self.set_menubar()
         self.setWindowTitle(f"Fractashades {fs.__version__}")
@@ -3474,7 +3766,7 @@ class Fractal_MainWindow(QMainWindow):
         elif txt == "License":
             self.show_license()
         else:
-            print("Unknow actiontrig")
+            logger.warning(f"Unknown action triggered: {txt}")
 
     def show_license(self):
         """
@@ -3556,8 +3848,7 @@ class Fractal_MainWindow(QMainWindow):
         choser.exec()
 
     def clear_cache(self):
-        func_submodel = self.from_register(("func",))
-        fractal = next(iter(func_submodel.getkwargs().values()))
+        fractal = next(iter(self._func_submodel.getkwargs().values()))
         fractal.clean_up()
         msg = Fractal_MessageBox()
         msg.setWindowTitle("Cache cleared")
@@ -3567,8 +3858,7 @@ class Fractal_MainWindow(QMainWindow):
     
     def layers_data(self):
         """ display in GUI the file with layers info"""
-        func_submodel = self.from_register(("func",))
-        fractal = next(iter(func_submodel.getkwargs().values()))
+        fractal = next(iter(self._func_submodel.getkwargs().values()))
         txt_report_path = fractal.txt_report_path
         txt_report_file = os.path.basename(txt_report_path)
 
@@ -3694,11 +3984,11 @@ class Fractal_MainWindow(QMainWindow):
     def add_func_wget(self):
         action_setting = (
             "image_updated", 
-            self.from_register("image")._mapping["image"]
+            self._image_presenter._mapping["image"]
         )
         func_wget = Action_func_widget(
             self,
-            self.from_register(("func",)),
+            self._func_submodel,
             action_setting,
             callback=True,
             may_interrupt=True,
@@ -3724,7 +4014,7 @@ class Fractal_MainWindow(QMainWindow):
     def add_status_bar(self):
         # the status bar need access to the fractal object, which will be
         # provided through the func model
-        self.status_bar = Calc_status_bar(self.from_register(("func",)))
+        self.status_bar = Calc_status_bar(self._func_submodel)
         self.setStatusBar(self.status_bar)
 
     @pyqtSlot(object)
@@ -3744,7 +4034,7 @@ class Fractal_MainWindow(QMainWindow):
         raise exc
 
     def add_image_wget(self):
-        mw = Image_widget(self, self.from_register("image"))
+        mw = Image_widget(self, self._image_presenter)
         self.setCentralWidget(mw)
 
     def from_register(self, register_key):
@@ -143,7 +143,7 @@ def script_assignments(kwargs, indent=0):
     """
     shift = " " * (4 * indent)
     ret = "\n".join(
-            [(k + " = " + script_repr(v)) for (k, v) in kwargs.items()]
+            f"{k} = {script_repr(v)}" for (k, v) in kwargs.items()
     )
     ret = shift + ret.replace("\n", "\n" + shift)
     return ret
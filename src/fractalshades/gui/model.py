@@ -15,7 +15,6 @@ from operator import getitem, setitem
 import numpy as np
 
 from PyQt6 import QtCore
-from PyQt6.QtCore import Qt
 from PyQt6.QtCore import pyqtSignal, pyqtSlot
 
 import fractalshades as fs
@@ -66,23 +65,24 @@ logger = logging.getLogger(__name__)
 #separator = typing.TypeVar('gui_separator')
 #collapsible_separator = typing.TypeVar('gui_collapsible_separator')
 
+# Generic default values for the base types
+DEFAULT_VALS = {
+    int: 0,
+    float: 0.,
+    mpmath.mpf: mpmath.mpf("0.0"),
+    str: "",
+    bool: False,
+    type(None): None,
+}
+
 def default_val(utype):
     """ Returns a generic default value for a given type"""
-    if utype is int:
-        return 0
-    elif utype is float:
-        return 0.
-    elif utype is mpmath.mpf:
-        return mpmath.mpf("0.0")
-    elif utype is str:
-        return ""
-    elif utype is bool:
-        return False
-    elif utype is type(None):
-        return None
-    elif typing.get_origin(utype) is typing.Literal:
+    if utype in DEFAULT_VALS:
+        return DEFAULT_VALS[utype]
+    origin = typing.get_origin(utype)
+    if origin is typing.Literal:
         return typing.get_args(utype)[0] # first element of the Literal
-    elif typing.get_origin(utype) is typing.Union:
+    elif origin is typing.Union:
         return default_val(typing.get_args(utype)[0]) # first def of the Union
     else:
         raise NotImplementedError("No default for this subtype {}".format(
@@ -107,24 +107,20 @@ def matching_instance(val, cast_type):
 
 def best_match(val, types):
     # Best match : casting litterals
-    is_litteral = tuple(typing.get_origin(t) is typing.Literal for t in types)
-    casted = tuple(can_cast(val, t) for t in types)
-    match = is_litteral and casted
-    if any(match):
-        index = match.index(max(match))
-        return index, types[index]
+    for index, t in enumerate(types):
+        if (typing.get_origin(t) is typing.Literal) and can_cast(val, t):
+            return index, t
     # then instance
-    match = tuple(matching_instance(val, t) for t in types)
-    if any(match):
-        index = match.index(max(match))
-        return index, types[index]
+    for index, t in enumerate(types):
+        if matching_instance(val, t):
+            return index, t
     # then can_cast
-    match = casted
-    if any(match):
-        index = match.index(max(match))
-        return index, types[index]
+    for index, t in enumerate(types):
+        if can_cast(val, t):
+            return index, t
     raise ValueError("No match for val {} and types {}".format(val, types))
 
+@functools.lru_cache(maxsize=None)
 def type_name(naming_type):
     """ The type as displayed in the GUI """
     if typing.get_origin(naming_type) is typing.Literal:
@@ -142,9 +138,9 @@ def typing_litteral_choices(ptype, p_name=None):
     choices = []
     for item in uargs:
         if isinstance(item, str):
-            choices += [item]
-        elif issubclass(item.__class__, enum.EnumMeta):
-            choices += [e.name for e in item] 
+            choices.append(item)
+        elif isinstance(item, enum.EnumMeta):
+            choices.extend(e.name for e in item)
         else:
             raise ValueError(
                 f"param {p_name}: Wrong type for typing.Literal: "
@@ -198,7 +194,10 @@ class Model(QtCore.QObject):
     def __getitem__(self, keys):
         # Gets an item value. keys is an iterable of nested keys
         try:
-           return functools.reduce(getitem, keys, self._model)
+            item = self._model
+            for key in keys:
+                item = item[key]
+            return item
         except KeyError:
             # key known by the Model, might be a specific Submodel
             # implementation
@@ -290,6 +289,8 @@ class Func_submodel(Submodel):
         """
         super().__init__(model, submodel_keys)
         self._func = func
+        self._signature = fs.gui.guitemplates.signature(func)
+        self._kwargs = None # cached `getkwargs` result
         self.build_dict()
         # Publish-subscribe model
         self.model_notification.connect(self._model.model_notified_slot)
@@ -301,7 +302,7 @@ class Func_submodel(Submodel):
     def get_key(self, pname, return_ptype=False):
         """ returns the model key associated with a func parameter
         """
-        sign = fs.gui.guitemplates.signature(self._func)
+        sign = self._signature
 
         for i_param, (name, param) in enumerate(sign.parameters.items()):
             if name == pname:
@@ -352,10 +353,13 @@ class Func_submodel(Submodel):
             (iparam, i_union, 'val') the value (*)
         """
         fd = self._dict #= dict()
-        sign = fs.gui.guitemplates.signature(self._func)
+        sign = self._signature
         fd["n_params"] = len(sign.parameters.items())
+        self._iparams = dict() # parameter name -> iparam
+        self._unpickables = set() # iparams not saved by `save_func_dict`
         for i_param, (name, param) in enumerate(sign.parameters.items()):
             self.insert_param(i_param, name, param)
+            self._iparams[name] = i_param
 
     def insert_param(self, i_param, name, param):
         """
@@ -422,6 +426,16 @@ class Func_submodel(Submodel):
         fd = self._dict
         fd[(i_param, i_union, "type")] = utype
 
+        if (
+            isinstance(utype, typing.TypeVar)
+            and (
+                utype.__name__
+                in ("gui_separator", "gui_collapsible_separator")
+            )
+        ):
+            # This is a gui separator
+            self._unpickables.add(i_param)
+
         if ((fd[(i_param, "n_types")] > 0)
                 and (i_union != fd[(i_param, "type_def")])):
             # Default val NOT applicable to this *union* type
@@ -432,7 +446,12 @@ class Func_submodel(Submodel):
             fd[(i_param, i_union, "val")] = fd[(i_param, "val_def")]
 
     def getkwargs(self):
-        """ Returns the current value of the kwargs """
+        """ Returns the current value of the kwargs
+        The result is cached until the next modification, and shall not be
+        modified by the caller """
+        if self._kwargs is not None:
+            return self._kwargs
+
         fd = self._dict
         n_params = fd["n_params"]
         kwargs = dict()
@@ -454,23 +473,23 @@ class Func_submodel(Submodel):
             for k, v in self._func.partial_vals.items():
                 kwargs[k] = v
 
+        self._kwargs = kwargs
         return kwargs
 
     def setkwarg(self, kwarg, val):
         """ sets the current value of the kwarg specified by its name """
         fd = self._dict
-        n_params = fd["n_params"]
-        for iparam in range(n_params):
-            if fd[(iparam, "name")] != kwarg:
-                continue
-            iunion = fd[(iparam, "type_sel")] # currently selected TODO  n_types / n_choices
-            ichoices = fd[(iparam, "n_choices")]
-            # If typing.Literal we infer the val from the choice index
-            if ichoices == 0 and iunion == 0:
-                param_key = (iparam, iunion, "val")
-                self.func_user_modified_slot(param_key, val)
-            else:
-                raise NotImplementedError()
+        iparam = self._iparams.get(kwarg)
+        if iparam is None:
+            return
+        iunion = fd[(iparam, "type_sel")] # currently selected TODO  n_types / n_choices
+        ichoices = fd[(iparam, "n_choices")]
+        # If typing.Literal we infer the val from the choice index
+        if ichoices == 0 and iunion == 0:
+            param_key = (iparam, iunion, "val")
+            self.func_user_modified_slot(param_key, val)
+        else:
+            raise NotImplementedError()
 
     @property
     def param0(self):
@@ -489,30 +508,12 @@ class Func_submodel(Submodel):
         - main Fractal object
         - gui-separators
         """
-        fd = self._dict.copy()
-        unpickables = []
-
-        for key, val in fd.items():
-            # We filter parameters : if any of the possible type is 
-            # unpickable, we add it to the unpickables
-            if isinstance(key, tuple) and len(key) == 3:
-                # Note: len = 3 pre-filters already on (`type`, `val`)
-                if key[2] == "type":
-                    if (
-                        isinstance(val, typing.TypeVar)
-                        and (
-                            val.__name__
-                            in ("gui_separator", "gui_collapsible_separator")
-                        )
-                    ):
-                        # This is a gui separator
-                        unpickables += [key[0]]
-
-        for key in list(fd.keys()): # copy through list as we modify on the fly
-            if isinstance(key, tuple):
-                iparam = key[0]
-                if iparam in unpickables:
-                    fd.pop(key)
+        # The unpickable parameters are identified at `insert_uarg` time
+        unpickables = self._unpickables
+        fd = {
+            key: val for (key, val) in self._dict.items()
+            if not (isinstance(key, tuple) and key[0] in unpickables)
+        }
 
         save_path = self.save_func_path()
         fs.utils.mkdir_p(os.path.dirname(save_path))
@@ -532,6 +533,7 @@ class Func_submodel(Submodel):
 
         for key in fd.keys():
             self._dict[key] = fd[key]
+        self._kwargs = None
 
 
     def __getitem__(self, key):
@@ -544,6 +546,8 @@ class Func_submodel(Submodel):
 
     def __setitem__(self, key, val):
         """ Adapted to also set the "current value" of a specific kwarg """
+        # Invalidates before notification, listeners might call `getkwargs`
+        self._kwargs = None
         try:
             super().__setitem__(key, val)
         except KeyError:
@@ -575,6 +579,7 @@ class Func_submodel(Submodel):
         )
         return script
 
+    @pyqtSlot(object, object)
     def model_event_slot(self, keys, val):
         if keys[:-1] != self._keys:
             return
@@ -662,6 +667,11 @@ class Presenter(QtCore.QObject):
         # oldval = self[key]
         self.model_changerequest.emit(self._mapping[key], val)
 
+    def update(self, vals):
+        """ Requests a change for several mapping items at once """
+        for key, val in vals.items():
+            self.model_changerequest.emit(self._mapping[key], val)
+
 #------------------------------------------------------------------------------
 
 class Array_presenter_mixin:
@@ -683,7 +693,12 @@ class Array_presenter_mixin:
         return self.data.n_rows
 
     def reset_old_data(self):
-        self.old_data = copy.deepcopy(self.data)
+        """ Snapshot of the shown data columns - only these are compared,
+        so there is no need to copy the full presented object """
+        self.old_data = {
+            col_key: copy.deepcopy(self.data.col_data(col_key))
+            for col_key in self.col_arr_items
+        }
 
     def col_data(self, col_key):
         """ Return the data column to be shown """
@@ -691,7 +706,7 @@ class Array_presenter_mixin:
 
     def old_col_data(self, col_key):
         """ Return the data column to be shown """
-        return self.old_data.col_data(col_key)
+        return self.old_data[col_key]
     
     def adjust_size(self, new_size):
         """
@@ -42,6 +42,11 @@ GUI_image_Mblimit = 0
 no limit (default). If limit exceeded, the image is still written to disk but 
 will not be interactively displayed in the GUI"""
 
+GUI_opengl_viewport: bool = False
+"""If True, the GUI image views are rendered through an OpenGL viewport
+(zoom and pan are then processed by the GPU). Falls back to the standard
+viewport if OpenGL widgets are not available"""
+
 def remove_decompression_size_check():
     """PIL sets a default output limit to 89478485 pixels
     (1024 * 1024 * 1024 // 4 // 3) and will raise a 